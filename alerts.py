@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# Non-blocking alert dispatch for new trading signals
+
+import json
+import platform
+import queue
+import subprocess
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+import pytz
+import requests
+from config import *
+
+Alert = namedtuple("Alert", ["pair", "signal", "signal_time", "created"])
+
+
+class SoundSink:
+    """Play one sound per batch of alerts"""
+
+    def __init__(self, sound_file=None):
+        self.sound_file = sound_file
+
+    def send(self, alerts):
+        if self.sound_file:
+            try:
+                from playsound import playsound
+                playsound(self.sound_file)
+                return
+            except ImportError:
+                pass
+        if platform.system() == 'Windows':
+            import winsound
+            winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
+        else:
+            print("\a", end="", flush=True)
+
+
+class DesktopNotificationSink:
+    """Show a native desktop notification"""
+
+    def send(self, alerts):
+        title = "Pocket Option Trader"
+        message = format_alerts(alerts)
+        system = platform.system()
+        if system == 'Windows':
+            script = (
+                "Add-Type -AssemblyName System.Windows.Forms;"
+                "$n = New-Object System.Windows.Forms.NotifyIcon;"
+                "$n.Icon = [System.Drawing.SystemIcons]::Information;"
+                "$n.Visible = $true;"
+                f"$n.ShowBalloonTip(5000, '{title}', '{message}', 'Info');"
+                "Start-Sleep -Seconds 5; $n.Dispose()"
+            )
+            command = ["powershell", "-NoProfile", "-Command", script]
+        elif system == 'Darwin':
+            command = ["osascript", "-e", f'display notification "{message}" with title "{title}"']
+        else:
+            command = ["notify-send", title, message]
+        subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+class WebhookSink:
+    """POST alert batches as JSON to a local webhook"""
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def send(self, alerts):
+        payload = {"alerts": [alert_to_dict(alert) for alert in alerts]}
+        response = self.session.post(self.url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+
+
+class FileSink:
+    """Append alerts to a file, one JSON object per line"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def send(self, alerts):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for alert in alerts:
+                f.write(json.dumps(alert_to_dict(alert)) + "\n")
+
+
+def alert_to_dict(alert):
+    """Serialise an alert for webhooks and files"""
+    return {
+        "pair": alert.pair,
+        "signal": alert.signal,
+        "signal_time": alert.signal_time.isoformat() if alert.signal_time else None,
+        "created": alert.created.isoformat()
+    }
+
+
+def format_alerts(alerts):
+    """Short human readable summary of a batch"""
+    return ", ".join(f"{alert.signal} {alert.pair}" for alert in alerts)
+
+
+def build_default_sinks():
+    """Create sinks enabled in config"""
+    sinks = []
+    if SOUND_ALERTS:
+        sinks.append(SoundSink(ALERT_SOUND_FILE))
+    if DESKTOP_ALERTS:
+        sinks.append(DesktopNotificationSink())
+    if ALERT_WEBHOOK_URL:
+        sinks.append(WebhookSink(ALERT_WEBHOOK_URL))
+    if ALERT_LOG_FILE:
+        sinks.append(FileSink(ALERT_LOG_FILE))
+    return sinks
+
+
+class AlertDispatcher:
+    """Queue signal alerts and deliver them to sinks on a worker thread"""
+
+    def __init__(self, sinks=None, batch_window=ALERT_BATCH_WINDOW, max_queue=ALERT_QUEUE_SIZE):
+        self.sinks = build_default_sinks() if sinks is None else sinks
+        self.batch_window = batch_window
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.sent = OrderedDict()  # (pair, candle) keys already alerted
+        self.dropped = 0
+        self.worker = threading.Thread(target=self._run, name="alert-dispatcher", daemon=True)
+        self.worker.start()
+
+    def publish(self, signals):
+        """Queue BUY/SELL signals from a refresh; never blocks the caller"""
+        if not self.sinks:
+            return
+        now = datetime.now(pytz.utc)
+        for pair, (signal, signal_time, _, _) in signals.items():
+            if signal not in ("BUY", "SELL"):
+                continue
+            try:
+                self.queue.put_nowait(Alert(pair, signal, signal_time, now))
+            except queue.Full:
+                self.dropped += 1
+
+    def stop(self):
+        """Stop the worker after pending alerts are delivered"""
+        self.queue.put(None)
+        self.worker.join(timeout=5)
+
+    def _run(self):
+        while True:
+            alert = self.queue.get()
+            if alert is None:
+                return
+
+            # Collect everything fired on the same candle close
+            batch = [alert]
+            deadline = time.monotonic() + self.batch_window
+            stop = False
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    alert = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if alert is None:
+                    stop = True
+                    break
+                batch.append(alert)
+
+            batch = self._debounce(batch)
+            if batch:
+                self._deliver(batch)
+            if stop:
+                return
+
+    def _debounce(self, batch):
+        """Keep one alert per pair and candle"""
+        fresh = []
+        for alert in batch:
+            key = (alert.pair, alert.signal_time)
+            if key in self.sent:
+                continue
+            self.sent[key] = alert.signal
+            fresh.append(alert)
+        while len(self.sent) > ALERT_HISTORY_SIZE:
+            self.sent.popitem(last=False)
+        return fresh
+
+    def _deliver(self, batch):
+        for sink in self.sinks:
+            try:
+                sink.send(batch)
+            except Exception as e:
+                print(f"Alert error ({type(sink).__name__}): {str(e)}")
@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+# Live candlestick chart with RSI and MACD panes for the dashboard
+
+import time
+import tkinter as tk
+import numpy as np
+from config import *
+
+try:
+    from matplotlib.figure import Figure
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.patches import Rectangle
+    from matplotlib.ticker import FuncFormatter
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+
+UP_COLOR = "#2e7d32"
+DOWN_COLOR = "#c62828"
+COLUMNS = ("open_time", "open", "high", "low", "close",
+           "rsi", "macd", "signal", "histogram")
+COL = {name: idx for idx, name in enumerate(COLUMNS)}
+MIN_VISIBLE_BARS = 30
+MIN_DRAW_POINTS = 100
+FULL_DRAW_SPACING = 10  # A full redraw taking F ms is not repeated within F * 10 ms
+
+
+def downsample_ohlc(x, o, h, l, c, max_points):
+    """Merge candles into buckets keeping first open, max high, min low and last close"""
+    n = len(x)
+    if n <= max_points:
+        return x, o, h, l, c, np.ones(n)
+    edges = np.linspace(0, n, max_points + 1).astype(int)
+    starts = edges[:-1]
+    ends = edges[1:] - 1
+    return (
+        (x[starts] + x[ends]) / 2.0,
+        o[starts],
+        np.maximum.reduceat(h, starts),
+        np.minimum.reduceat(l, starts),
+        c[ends],
+        (ends - starts + 1).astype(float)
+    )
+
+
+def downsample_minmax(x, y, max_points):
+    """Decimate a line to about max_points while keeping each bucket's min and max"""
+    n = len(x)
+    if n <= max_points:
+        return x, y
+    buckets = max(1, max_points // 2)
+    bucket = np.repeat(np.arange(buckets), np.diff(np.linspace(0, n, buckets + 1).astype(int)))
+    starts = np.flatnonzero(np.diff(bucket, prepend=-1))
+
+    # Sorting by (bucket, value) puts each bucket's min first; NaN sorts last
+    low = np.lexsort((y, bucket))[starts]
+    high = np.lexsort((-y, bucket))[starts]
+    idx = np.column_stack([np.minimum(low, high), np.maximum(low, high)]).ravel()
+    idx = idx[np.r_[True, idx[1:] != idx[:-1]]]
+    return x[idx], y[idx]
+
+
+def indicator_periods(df):
+    """Indicator settings a frame was calculated with, as stamped by the signal generator"""
+    return df.attrs.get('rsi_period'), df.attrs.get('macd_periods')
+
+
+class LiveChartPanel:
+    """Incrementally updated chart for a single trading pair"""
+
+    def __init__(self, parent, bg_color, fg_color):
+        self.pair = None
+        self.visible_bars = MAX_CANDLES
+        self.max_points = CHART_MAX_POINTS
+        self.last_render_ms = 0.0
+        self.last_full_ms = 0.0
+        self._data = np.empty((CHART_HISTORY, len(COLUMNS)))
+        self._size = 0
+        self._forming = None
+        self._markers = {}
+        self._history = None
+        self._indicators = None
+        self._backgrounds = None
+        self._pending = None
+        self._dirty_full = False
+        self._dirty_axes = set()
+        self._last_frame = 0.0
+        self._last_full = 0.0
+
+        # Figure with price, RSI and MACD panes sharing the bar axis
+        self.figure = Figure(figsize=(8, 6), dpi=100, facecolor=bg_color)
+        grid = self.figure.add_gridspec(3, 1, height_ratios=(3, 1, 1), hspace=0.05)
+        self.price_ax = self.figure.add_subplot(grid[0])
+        self.rsi_ax = self.figure.add_subplot(grid[1], sharex=self.price_ax)
+        self.macd_ax = self.figure.add_subplot(grid[2], sharex=self.price_ax)
+        for ax in (self.price_ax, self.rsi_ax, self.macd_ax):
+            ax.set_facecolor(bg_color)
+            ax.tick_params(colors=fg_color, labelsize=8)
+            ax.grid(True, alpha=0.15)
+        self.price_ax.tick_params(labelbottom=False)
+        self.rsi_ax.tick_params(labelbottom=False)
+        self.macd_ax.xaxis.set_major_formatter(FuncFormatter(self._format_time))
+
+        # Data artists are animated: full draws only render the axes, and
+        # candles, markers and indicators are blitted over that background
+        # Closed candles
+        self.wicks = LineCollection([], linewidths=1, animated=True)
+        self.bodies = PolyCollection([], linewidths=0, animated=True)
+        self.price_ax.add_collection(self.wicks)
+        self.price_ax.add_collection(self.bodies)
+
+        # Forming candle
+        self.forming_wick, = self.price_ax.plot([], [], linewidth=1, animated=True)
+        self.forming_body = Rectangle((0, 0), 0, 0, linewidth=0, animated=True)
+        self.price_ax.add_patch(self.forming_body)
+
+        # Signal markers
+        self.buy_marks, = self.price_ax.plot(
+            [], [], linestyle='None', marker='^', markersize=9, color=UP_COLOR, animated=True
+        )
+        self.sell_marks, = self.price_ax.plot(
+            [], [], linestyle='None', marker='v', markersize=9, color=DOWN_COLOR, animated=True
+        )
+
+        # RSI pane
+        self.rsi_line, = self.rsi_ax.plot([], [], linewidth=1, color="#7e57c2", animated=True)
+        self.rsi_upper = self.rsi_ax.axhline(RSI_OVERBOUGHT, linestyle='--', linewidth=0.8, color=DOWN_COLOR)
+        self.rsi_lower = self.rsi_ax.axhline(RSI_OVERSOLD, linestyle='--', linewidth=0.8, color=UP_COLOR)
+        self.rsi_ax.set_ylim(0, 100)
+
+        # MACD pane
+        self.macd_line, = self.macd_ax.plot([], [], linewidth=1, color="#0078d7", animated=True)
+        self.signal_line, = self.macd_ax.plot([], [], linewidth=1, color="#f57f17", animated=True)
+        self.hist_bars = LineCollection([], linewidths=2, alpha=0.6, animated=True)
+        self.macd_ax.add_collection(self.hist_bars)
+
+        # Animated artists per axes, blitted independently
+        self.artists = {
+            self.price_ax: (self.wicks, self.bodies, self.forming_wick, self.forming_body,
+                            self.buy_marks, self.sell_marks),
+            self.rsi_ax: (self.rsi_line,),
+            self.macd_ax: (self.hist_bars, self.macd_line, self.signal_line)
+        }
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=parent)
+        self.widget = self.canvas.get_tk_widget()
+        self.widget.pack(fill=tk.BOTH, expand=True)
+        self.widget.bind('<Map>', lambda event: self.request_redraw(full=True))
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('scroll_event', self._on_scroll)
+
+    def update_data(self, pair, df, markers=None, history=None):
+        """Append new closed candles and refresh the forming candle
+
+        history, when given, holds older candles for the pair; the buffer is
+        rebuilt from it whenever a different history frame is passed in.
+        """
+        if df is None or len(df) == 0:
+            return
+        if pair != self.pair:
+            self.pair = pair
+            self._forming = None
+            self._markers = {}
+            self.visible_bars = MAX_CANDLES
+            self._reset()
+
+        # Bars computed with other indicator periods must not be mixed in
+        indicators = indicator_periods(df)
+        if indicators != self._indicators:
+            self._indicators = indicators
+            self._reset()
+        if history is not None and indicator_periods(history) != indicators:
+            history = None
+        if history is not None and history is not self._history:
+            self._reset()
+            self._history = history
+            now_ms = time.time() * 1000
+            closed = history[history['close_time'] < now_ms]
+            self._append(closed[list(COLUMNS)].to_numpy(dtype=float))
+
+        rows = df[list(COLUMNS)].to_numpy(dtype=float)
+        now_ms = time.time() * 1000
+        forming = None
+        if df['close_time'].iloc[-1] >= now_ms:
+            forming = rows[-1]
+            rows = rows[:-1]
+
+        # Only bars newer than the last stored one are appended
+        dirty = set()
+        if self._size:
+            last_time = self._data[self._size - 1, COL["open_time"]]
+            rows = rows[rows[:, COL["open_time"]] > last_time]
+        if len(rows):
+            # Dropping old bars shifts every x position, so the axes are rebuilt
+            if self._append(rows):
+                self._dirty_full = True
+            dirty.update(self.artists)
+
+        if markers is not None and dict(markers) != self._markers:
+            self._markers = dict(markers)
+            dirty.add(self.price_ax)
+
+        if forming is not None:
+            if self._forming is None or not np.array_equal(forming, self._forming, equal_nan=True):
+                self._forming = forming
+                dirty.add(self.price_ax)
+        elif self._forming is not None:
+            self._forming = None
+            dirty.add(self.price_ax)
+
+        if dirty:
+            self.request_redraw(axes=dirty)
+
+    def _reset(self):
+        """Empty the bar buffer; the next frame redraws the axes without waiting"""
+        self._size = 0
+        self._history = None
+        self._dirty_full = True
+        self._last_full = 0.0
+
+    def request_redraw(self, full=False, axes=None):
+        """Schedule a frame no sooner than the frame budget allows"""
+        self._dirty_full = self._dirty_full or full
+        self._dirty_axes.update(axes if axes is not None else self.artists)
+        if self._pending is not None:
+            return
+        elapsed = (time.perf_counter() - self._last_frame) * 1000
+        delay = int(max(0, CHART_FRAME_BUDGET_MS - elapsed))
+        self._pending = self.widget.after(delay, self._render_frame)
+
+    def _append(self, rows):
+        """Store new closed bars, dropping the oldest beyond CHART_HISTORY; returns the drop count"""
+        rows = rows[-CHART_HISTORY:]
+        overflow = max(0, self._size + len(rows) - CHART_HISTORY)
+        if overflow:
+            self._data[:self._size - overflow] = self._data[overflow:self._size]
+            self._size -= overflow
+        self._data[self._size:self._size + len(rows)] = rows
+        self._size += len(rows)
+        return overflow
+
+    def _render_frame(self):
+        """Run one scheduled frame: a rate-limited full draw or a blit of the dirty axes"""
+        self._pending = None
+        if not self._size or not self.widget.winfo_ismapped():
+            return
+
+        if self._dirty_full or self._backgrounds is None:
+            # Full draws cost per-axes overhead no point budget can shrink,
+            # so they are spaced out instead of repeated on every change
+            wait = self._last_full + self.last_full_ms * FULL_DRAW_SPACING / 1000 - time.perf_counter()
+            if wait <= 0 or self._backgrounds is None:
+                start = time.perf_counter()
+                self._dirty_full = False
+                self._dirty_axes.clear()
+                self._draw_full()
+                self._last_full = self._last_frame = time.perf_counter()
+                self.last_full_ms = (self._last_full - start) * 1000
+                return
+            self._pending = self.widget.after(int(wait * 1000) + 1, self._render_frame)
+
+        if not self._dirty_axes:
+            return
+        start = time.perf_counter()
+        axes, self._dirty_axes = self._dirty_axes, set()
+        if not self._fits(self._update_artists()):
+            self._dirty_full = True
+            self.request_redraw(axes=())
+        self._blit(axes)
+        self._last_frame = time.perf_counter()
+        self.last_render_ms = (self._last_frame - start) * 1000
+
+        # Trade detail for speed when a blitted frame overruns the budget
+        if self.last_render_ms > CHART_FRAME_BUDGET_MS:
+            self.max_points = max(MIN_DRAW_POINTS, self.max_points // 2)
+        elif self.last_render_ms < CHART_FRAME_BUDGET_MS / 2:
+            self.max_points = min(CHART_MAX_POINTS, self.max_points * 2)
+
+    def _draw_full(self):
+        """Fit the axes to the visible window and redraw the static background"""
+        n = self._size
+        start = max(0, n - self.visible_bars)
+
+        # Headroom on the right so new bars usually fit without a full draw
+        self.price_ax.set_xlim(start - 1, n + 1 + max(2, self.visible_bars // 10))
+        low, high, macd_span = self._update_artists()
+        margin = (high - low) * 0.08 or abs(high) * 0.001 or 1.0
+        self.price_ax.set_ylim(low - margin, high + margin)
+        self.macd_ax.set_ylim(-macd_span * 1.1, macd_span * 1.1)
+        self.rsi_upper.set_ydata([RSI_OVERBOUGHT, RSI_OVERBOUGHT])
+        self.rsi_lower.set_ydata([RSI_OVERSOLD, RSI_OVERSOLD])
+        self.price_ax.set_title(self.pair or "", fontsize=10, loc='left')
+
+        self.canvas.draw()
+
+    def _update_artists(self):
+        """Load the visible window into the animated artists; returns (low, high, macd span)"""
+        n = self._size
+        start = min(max(0, int(np.floor(self.price_ax.get_xlim()[0])) + 1), n - 1)
+        data = self._data[start:n]
+        x = np.arange(start, n, dtype=float)
+
+        # Candles
+        xs, o, h, l, c, width = downsample_ohlc(
+            x, data[:, COL["open"]], data[:, COL["high"]],
+            data[:, COL["low"]], data[:, COL["close"]], self.max_points
+        )
+        half = width * 0.35
+        colors = np.where(c >= o, UP_COLOR, DOWN_COLOR)
+        self.wicks.set_segments(np.stack([np.column_stack([xs, l]), np.column_stack([xs, h])], axis=1))
+        self.wicks.set_color(colors)
+        self.bodies.set_verts(np.stack([
+            np.column_stack([xs - half, o]), np.column_stack([xs + half, o]),
+            np.column_stack([xs + half, c]), np.column_stack([xs - half, c])
+        ], axis=1))
+        self.bodies.set_facecolor(colors)
+
+        # Indicators
+        self.rsi_line.set_data(*downsample_minmax(x, data[:, COL["rsi"]], self.max_points))
+        self.macd_line.set_data(*downsample_minmax(x, data[:, COL["macd"]], self.max_points))
+        self.signal_line.set_data(*downsample_minmax(x, data[:, COL["signal"]], self.max_points))
+        hx, hy = downsample_minmax(x, data[:, COL["histogram"]], self.max_points)
+        self.hist_bars.set_segments(np.stack([np.column_stack([hx, np.zeros_like(hy)]), np.column_stack([hx, hy])], axis=1))
+        self.hist_bars.set_color(np.where(hy >= 0, UP_COLOR, DOWN_COLOR))
+
+        self._draw_markers(start)
+        self._draw_forming()
+
+        low, high = np.nanmin(l), np.nanmax(h)
+        if self._forming is not None:
+            low = min(low, self._forming[COL["low"]])
+            high = max(high, self._forming[COL["high"]])
+        macd_values = data[:, [COL["macd"], COL["signal"], COL["histogram"]]]
+        macd_span = np.nanmax(np.abs(macd_values)) if np.isfinite(macd_values).any() else 1.0
+        return low, high, macd_span
+
+    def _draw_markers(self, start):
+        """Place BUY/SELL markers on the bars they fired on"""
+        times = self._data[:self._size, COL["open_time"]]
+        buys = ([], [])
+        sells = ([], [])
+        for open_time, signal in self._markers.items():
+            if self._forming is not None and open_time == self._forming[COL["open_time"]]:
+                idx, row = self._size, self._forming
+            else:
+                idx = int(np.searchsorted(times, open_time))
+                if idx >= self._size or times[idx] != open_time:
+                    continue
+                row = self._data[idx]
+            if idx < start:
+                continue
+            if signal == "BUY":
+                buys[0].append(idx)
+                buys[1].append(row[COL["low"]])
+            elif signal == "SELL":
+                sells[0].append(idx)
+                sells[1].append(row[COL["high"]])
+        self.buy_marks.set_data(*buys)
+        self.sell_marks.set_data(*sells)
+
+    def _draw_forming(self):
+        """Place the forming candle one slot right of the last closed bar"""
+        if self._forming is None:
+            self.forming_wick.set_data([], [])
+            self.forming_body.set_visible(False)
+            return
+        x = float(self._size)
+        o, h, l, c = (self._forming[COL[k]] for k in ("open", "high", "low", "close"))
+        color = UP_COLOR if c >= o else DOWN_COLOR
+        self.forming_wick.set_data([x, x], [l, h])
+        self.forming_wick.set_color(color)
+        self.forming_body.set_bounds(x - 0.35, min(o, c), 0.7, abs(c - o))
+        self.forming_body.set_facecolor(color)
+        self.forming_body.set_visible(True)
+
+    def _fits(self, extents):
+        """Check the visible data still lies inside the current axes limits"""
+        low, high, macd_span = extents
+        right = self._size if self._forming is not None else self._size - 1
+        y_low, y_high = self.price_ax.get_ylim()
+        return (
+            right <= self.price_ax.get_xlim()[1] - 1
+            and y_low <= low and high <= y_high
+            and macd_span <= self.macd_ax.get_ylim()[1]
+        )
+
+    def _blit(self, axes):
+        """Redraw the animated artists of each dirty axes over its own background"""
+        for ax in axes:
+            self.canvas.restore_region(self._backgrounds[ax])
+            for artist in self.artists[ax]:
+                ax.draw_artist(artist)
+            self.canvas.blit(ax.bbox)
+
+    def _on_draw(self, event):
+        """Capture per-axes backgrounds after every full draw, including resizes"""
+        self._backgrounds = {ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self.artists}
+        for ax, artists in self.artists.items():
+            for artist in artists:
+                ax.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def _on_scroll(self, event):
+        """Zoom the visible window with the mouse wheel"""
+        if event.button == 'up':
+            self.visible_bars = max(MIN_VISIBLE_BARS, int(self.visible_bars * 0.8))
+        else:
+            self.visible_bars = min(max(self._size, MIN_VISIBLE_BARS), int(self.visible_bars * 1.25) + 1)
+        self.request_redraw(full=True)
+
+    def _format_time(self, x, pos=None):
+        """Label bar positions with their UTC open time"""
+        idx = int(round(x))
+        if 0 <= idx < self._size:
+            open_time = self._data[idx, COL["open_time"]]
+        elif idx >= self._size > 1:
+            # Headroom right of the last bar is labelled with the times to come
+            last = self._data[self._size - 1, COL["open_time"]]
+            step = last - self._data[self._size - 2, COL["open_time"]]
+            open_time = last + (idx - self._size + 1) * step
+        else:
+            return ""
+        return time.strftime("%H:%M", time.gmtime(open_time / 1000))
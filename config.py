@@ -12,6 +12,26 @@ TRADING_PAIRS = [
 API_URL = "https://api.binance.com/api/v3/klines"
 TIMEFRAME = "5m"  # 5-minute candles
 
+# Exchange symbol per trading pair. Pairs without an entry are not requested
+# from that provider; forex pairs with no USDT market need a forex provider.
+BINANCE_SYMBOLS = {
+    "BTC/USD": "BTCUSDT", "ETH/USD": "ETHUSDT", "LTC/USD": "LTCUSDT",
+    "XRP/USD": "XRPUSDT", "BCH/USD": "BCHUSDT", "EUR/USD": "EURUSDT"
+}
+
+# Market data providers in order of preference (Binance-compatible klines)
+MARKET_DATA_PROVIDERS = [
+    {"name": "binance", "url": API_URL, "symbols": BINANCE_SYMBOLS},
+    {"name": "binance-vision", "url": "https://data-api.binance.vision/api/v3/klines",
+     "symbols": BINANCE_SYMBOLS}
+]
+HEDGE_PERCENTILE = 90        # Send a duplicate request after this latency percentile
+HEDGE_MIN_DELAY = 0.2        # Seconds, lower bound for the hedge delay
+HEDGE_DEFAULT_DELAY = 1.0    # Seconds, used until enough latency samples exist
+HEDGE_MIN_SAMPLES = 20       # Latency samples needed before using the percentile
+LATENCY_SAMPLES = 200        # Recent latencies kept per provider
+MARKET_DATA_WORKERS = 8      # Threads for concurrent provider requests
+
 # Technical Indicator Parameters
 RSI_PERIOD = 14
 MACD_FAST = 12
@@ -22,12 +42,42 @@ MACD_SIGNAL = 9
 RSI_OVERBOUGHT = 68  # Default: 68
 RSI_OVERSOLD = 32    # Default: 32
 CONFIRMATION_CANDLES = 2  # Number of candles for confirmation
+PAYOUT = 0.92             # Payout ratio on a winning trade
+
+# Strategy Statistics
+STATS_WINDOW = 50              # Settled signals per pair/direction in rolling stats
+STATS_EXPIRY_CANDLES = 1       # Candles after the signal bar until a trade settles
+STATS_MAX_RUN = 10             # Longest run tracked after a signal
+STATS_PAUSE_ENABLED = False    # Pause signals for pairs performing badly
+STATS_PAUSE_MIN_TRADES = 20    # Settled signals needed before pausing
+STATS_PAUSE_MIN_WIN_RATE = 0.55  # Pause below this win rate (breakeven ~0.52 at 92%)
+STATS_JOURNAL_FILE = "signal_journal.csv"  # Settled signals for risk_simulator.py, None to disable
 
 # Application Settings
 REFRESH_INTERVAL = 30  # Seconds between updates
 UI_THEME = "system"   # Options: light/dark/system
 SOUND_ALERTS = True   # Play sound for new signals
 MAX_CANDLES = 100     # Number of candles to fetch
+CONFIG_POLL_INTERVAL = 2  # Seconds between checks for config.py changes
+UI_FRAME_MS = 100     # Milliseconds between UI state updates
+STATE_QUEUE_SIZE = 8  # Pending UI snapshots before the oldest are dropped
+
+# Alert Settings
+ALERT_SOUND_FILE = None      # Custom sound (needs playsound), None for system beep
+DESKTOP_ALERTS = False       # Show desktop notifications
+ALERT_WEBHOOK_URL = None     # e.g. "http://127.0.0.1:8080/alerts"
+ALERT_LOG_FILE = None        # e.g. "alerts.log"
+ALERT_BATCH_WINDOW = 1.0     # Seconds to collect alerts into one batch
+ALERT_QUEUE_SIZE = 256       # Pending alerts before new ones are dropped
+ALERT_HISTORY_SIZE = 1000    # Pair/candle keys remembered for debouncing
+
+# Chart Settings
+CHART_HISTORY = 2000         # Bars kept per chart for zooming out
+CHART_MAX_POINTS = 400       # Max points drawn per series (min/max downsampled)
+CHART_FRAME_BUDGET_MS = 50   # Render budget per blitted chart frame
+
+# Pocket Option API (mock_exchange.py serves it at http://127.0.0.1:8081/api)
+PO_API_URL = "https://pocketoption.com/api"
 
 # Pocket Option Credentials (Placeholder)
 PO_EMAIL = "your@email.com"
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Reload config.py at runtime and work out what a change affects
+
+import importlib
+import os
+import sys
+from collections import namedtuple
+import config
+
+# Modules that read settings through "from config import *"
+HOT_MODULES = ("signal_generator", "strategy_stats", "chart_view", "market_data", "alerts")
+
+# Settings that only feed indicator calculations
+INDICATOR_SETTINGS = {
+    "RSI_PERIOD": "rsi",
+    "MACD_FAST": "macd",
+    "MACD_SLOW": "macd",
+    "MACD_SIGNAL": "macd"
+}
+
+# Settings that only feed the signal rules
+RULE_SETTINGS = {
+    "RSI_OVERBOUGHT", "RSI_OVERSOLD", "CONFIRMATION_CANDLES",
+    "STATS_PAUSE_ENABLED", "STATS_PAUSE_MIN_TRADES", "STATS_PAUSE_MIN_WIN_RATE"
+}
+
+# Settings captured when objects are created; provider symbol tables are
+# swapped in place by the signal generator instead
+RESTART_SETTINGS = {
+    "API_URL", "MARKET_DATA_WORKERS", "LATENCY_SAMPLES", "UI_THEME", "CHART_HISTORY",
+    "PAYOUT", "STATS_WINDOW", "STATS_EXPIRY_CANDLES", "STATS_MAX_RUN", "SOUND_ALERTS",
+    "DESKTOP_ALERTS", "ALERT_SOUND_FILE", "ALERT_WEBHOOK_URL", "ALERT_LOG_FILE", "ALERT_BATCH_WINDOW",
+    "ALERT_QUEUE_SIZE", "ALERT_HISTORY_SIZE", "PO_API_URL", "PO_EMAIL", "PO_PASSWORD",
+    "STATE_QUEUE_SIZE"
+}
+
+ConfigChange = namedtuple("ConfigChange", [
+    "changed",        # setting -> (old, new)
+    "indicators",     # indicator names to recompute
+    "rules",          # True when rules must be re-evaluated
+    "added_pairs",
+    "removed_pairs",
+    "restart"         # settings that need a restart to take full effect
+])
+
+
+def settings_snapshot(module):
+    """Public upper-case settings of a config module"""
+    return {
+        name: value for name, value in vars(module).items()
+        if name.isupper() and not name.startswith("_")
+    }
+
+
+def diff_settings(old, new):
+    """Classify the difference between two settings snapshots"""
+    changed = {
+        name: (old.get(name), new.get(name))
+        for name in set(old) | set(new)
+        if old.get(name) != new.get(name)
+    }
+    indicators = {INDICATOR_SETTINGS[name] for name in changed if name in INDICATOR_SETTINGS}
+    old_pairs = old.get("TRADING_PAIRS", [])
+    new_pairs = new.get("TRADING_PAIRS", [])
+    return ConfigChange(
+        changed=changed,
+        indicators=indicators,
+        rules=bool(indicators) or any(name in RULE_SETTINGS for name in changed),
+        added_pairs=[pair for pair in new_pairs if pair not in old_pairs],
+        removed_pairs=[pair for pair in old_pairs if pair not in new_pairs],
+        restart=sorted(name for name in changed if name in RESTART_SETTINGS)
+    )
+
+
+class ConfigWatcher:
+    """Poll config.py and push changed settings into running modules"""
+
+    def __init__(self, modules=()):
+        self.modules = list(modules) + [
+            sys.modules[name] for name in HOT_MODULES if name in sys.modules
+        ]
+        self.path = config.__file__
+        self.mtime = self._mtime()
+        self.settings = settings_snapshot(config)
+
+    def _mtime(self):
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def changed_on_disk(self):
+        """Cheap check suitable for a UI timer"""
+        return self._mtime() != self.mtime
+
+    def reload(self):
+        """Reload config.py and return a ConfigChange, or None if nothing changed"""
+        self.mtime = self._mtime()
+        try:
+            importlib.reload(config)
+        except Exception as e:
+            print(f"Config reload error: {str(e)}")
+            return None
+
+        settings = settings_snapshot(config)
+        change = diff_settings(self.settings, settings)
+        if not change.changed:
+            return None
+        self.settings = settings
+
+        # Rebind names imported with "from config import *"
+        for module in self.modules:
+            for name in change.changed:
+                if name in settings:
+                    setattr(module, name, settings[name])
+
+        print(f"Config reloaded: {', '.join(sorted(change.changed))}")
+        if change.restart:
+            print(f"Restart required for: {', '.join(change.restart)}")
+        return change
@@ -9,6 +9,10 @@ import os
 import sys
 import platform
 from signal_generator import TradingSignalGenerator
+from alerts import AlertDispatcher
+from config_watcher import ConfigWatcher
+from ui_state import DashboardSnapshot, StatePipeline, freeze
+from chart_view import LiveChartPanel, MATPLOTLIB_AVAILABLE
 from config import *
 
 class TradingSignalDashboard:
@@ -31,7 +35,22 @@ class TradingSignalDashboard:
         self.active_signals = {}
         self.last_signals = {}
         self.last_update = datetime.now(pytz.utc)
-        self.refresh_signals()
+        self.next_refresh = self.last_update
+        self.signal_marks = {}
+        self.alerts = AlertDispatcher()
+        self.config_watcher = ConfigWatcher([sys.modules[__name__]])
+        
+        # Worker threads publish snapshots; only the Tk thread touches widgets
+        self.model_lock = threading.RLock()
+        self.state = StatePipeline(STATE_QUEUE_SIZE)
+        self.snapshot = None
+        self.showing_error = False
+        self.config_generation = 0  # Bumped on every applied config reload
+        self.history_requests = set()
+        self.start_refresh_worker()
+        self.select_chart_pair()
+        self.process_state()
+        self.watch_config()
 
     def setup_ui(self):
         """Configure UI based on theme"""
@@ -126,17 +145,12 @@ class TradingSignalDashboard:
         title_label.pack(side=tk.LEFT, padx=10, pady=5)
         
         # Strategy info
-        strategy_text = (
-            f"Strategy: RSI({RSI_PERIOD}) | "
-            f"MACD({MACD_FAST},{MACD_SLOW},{MACD_SIGNAL}) | "
-            f"Assets: {len(TRADING_PAIRS)} Pairs"
-        )
-        strategy_label = ttk.Label(
+        self.strategy_label = ttk.Label(
             header_frame,
-            text=strategy_text,
+            text=self.get_strategy_text(),
             style='Header.TLabel'
         )
-        strategy_label.pack(side=tk.LEFT, padx=20, pady=5)
+        self.strategy_label.pack(side=tk.LEFT, padx=20, pady=5)
         
         # Refresh button
         refresh_btn = ttk.Button(
@@ -169,6 +183,16 @@ class TradingSignalDashboard:
         active_frame = ttk.Frame(notebook)
         notebook.add(active_frame, text="Active Signals")
         self.create_active_signals_table(active_frame)
+        
+        # Strategy Stats Tab
+        stats_frame = ttk.Frame(notebook)
+        notebook.add(stats_frame, text="Strategy Stats")
+        self.create_stats_table(stats_frame)
+        
+        # Live Chart Tab
+        chart_frame = ttk.Frame(notebook)
+        notebook.add(chart_frame, text="Live Chart")
+        self.create_chart_tab(chart_frame)
 
     def create_pure_signal_table(self, parent):
         """Create pure signals table"""
@@ -211,6 +235,7 @@ class TradingSignalDashboard:
         self.pure_tree.tag_configure('SELL', background='#ffebee', foreground='#c62828')
         self.pure_tree.tag_configure('HOLD', background='#e3f2fd', foreground='#1565c0')
         self.pure_tree.tag_configure('ERROR', background='#f5f5f5', foreground='#9e9e9e')
+        self.pure_tree.tag_configure('PAUSED', background='#fff9c4', foreground='#f57f17')
 
     def create_confirmation_table(self, parent):
         """Create confirmation table"""
@@ -302,6 +327,86 @@ class TradingSignalDashboard:
         self.active_tree.tag_configure('LOSS', background='#ffebee', foreground='#c62828')
         self.active_tree.tag_configure('CLOSED', background='#f5f5f5', foreground='#9e9e9e')
 
+    def create_stats_table(self, parent):
+        """Create rolling strategy statistics table"""
+        # Create treeview with scrollbar
+        tree_frame = ttk.Frame(parent)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Configure columns
+        columns = ("pair", "signal", "trades", "win_rate", "avg_run", "expectancy", "open")
+        
+        self.stats_tree = ttk.Treeview(
+            tree_frame, 
+            columns=columns, 
+            show="headings",
+            selectmode="browse"
+        )
+        
+        # Set column headings
+        self.stats_tree.heading("pair", text="Trading Pair", anchor=tk.CENTER)
+        self.stats_tree.heading("signal", text="Signal", anchor=tk.CENTER)
+        self.stats_tree.heading("trades", text="Settled", anchor=tk.CENTER)
+        self.stats_tree.heading("win_rate", text="Win Rate", anchor=tk.CENTER)
+        self.stats_tree.heading("avg_run", text="Avg Run", anchor=tk.CENTER)
+        self.stats_tree.heading("expectancy", text="Expectancy", anchor=tk.CENTER)
+        self.stats_tree.heading("open", text="Open", anchor=tk.CENTER)
+        
+        # Set column widths
+        self.stats_tree.column("pair", width=150, anchor=tk.CENTER)
+        self.stats_tree.column("signal", width=100, anchor=tk.CENTER)
+        self.stats_tree.column("trades", width=100, anchor=tk.CENTER)
+        self.stats_tree.column("win_rate", width=120, anchor=tk.CENTER)
+        self.stats_tree.column("avg_run", width=120, anchor=tk.CENTER)
+        self.stats_tree.column("expectancy", width=120, anchor=tk.CENTER)
+        self.stats_tree.column("open", width=80, anchor=tk.CENTER)
+        
+        # Add scrollbar
+        scrollbar = ttk.Scrollbar(
+            tree_frame, 
+            orient=tk.VERTICAL, 
+            command=self.stats_tree.yview
+        )
+        self.stats_tree.configure(yscroll=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.stats_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Configure tags
+        self.stats_tree.tag_configure('PROFIT', background='#e8f5e9', foreground='#2e7d32')
+        self.stats_tree.tag_configure('LOSS', background='#ffebee', foreground='#c62828')
+        self.stats_tree.tag_configure('N/A', background='#f5f5f5', foreground='#9e9e9e')
+
+    def create_chart_tab(self, parent):
+        """Create live chart for the selected pair"""
+        # Pair selector
+        toolbar = ttk.Frame(parent)
+        toolbar.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Label(toolbar, text="Trading Pair:").pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.chart_pair = tk.StringVar(value=TRADING_PAIRS[0])
+        self.pair_box = ttk.Combobox(
+            toolbar,
+            textvariable=self.chart_pair,
+            values=TRADING_PAIRS,
+            state="readonly",
+            width=12
+        )
+        self.pair_box.pack(side=tk.LEFT)
+        self.pair_box.bind("<<ComboboxSelected>>", lambda event: self.select_chart_pair())
+        
+        chart_frame = ttk.Frame(parent)
+        chart_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        if not MATPLOTLIB_AVAILABLE:
+            self.chart_panel = None
+            ttk.Label(
+                chart_frame,
+                text="Install matplotlib to enable live charts"
+            ).pack(expand=True)
+            return
+        
+        self.chart_panel = LiveChartPanel(chart_frame, self.bg_color, self.fg_color)
+
     def create_status_bar(self):
         """Create status bar at bottom"""
         status_frame = ttk.Frame(self.root, style='Status.TFrame')
@@ -322,6 +427,13 @@ class TradingSignalDashboard:
         )
         self.next_label.pack(side=tk.LEFT, padx=20, pady=2)
         
+        self.status_label = ttk.Label(
+            status_frame, 
+            text="Status: Starting...",
+            style='Status.TLabel'
+        )
+        self.status_label.pack(side=tk.LEFT, padx=20, pady=2)
+        
         self.candle_label = ttk.Label(
             status_frame, 
             text="Next candle: --:--:--",
@@ -329,40 +441,106 @@ class TradingSignalDashboard:
         )
         self.candle_label.pack(side=tk.RIGHT, padx=10, pady=2)
 
+    def start_refresh_worker(self):
+        """Start the single background thread that refreshes signals"""
+        self.refresh_requested = threading.Event()
+        self.refresh_requested.set()  # Refresh immediately on start
+        threading.Thread(target=self.refresh_loop, name="signal-refresh", daemon=True).start()
+
+    def refresh_loop(self):
+        """Refresh every REFRESH_INTERVAL seconds or when a refresh is requested"""
+        while True:
+            self.refresh_requested.wait(timeout=REFRESH_INTERVAL)
+            self.refresh_requested.clear()
+            self.refresh_signals()
+
     def refresh_signals(self):
-        """Periodically refresh trading signals"""
-        def update_task():
-            try:
-                start_time = time.time()
-                signals = self.signal_generator.get_all_signals()
-                update_time = datetime.now(pytz.utc)
-                next_refresh = update_time + timedelta(seconds=REFRESH_INTERVAL)
-                
-                # Update UI
-                self.root.after(0, self.update_ui, signals, update_time, next_refresh)
-                
-                # Update active signals
-                self.update_active_signals(signals)
-                
-                # Log performance
-                elapsed = time.time() - start_time
-                print(f"Signal refresh completed in {elapsed:.2f} seconds")
-                
-            except Exception as e:
-                self.root.after(0, self.show_error, "Refresh Error", str(e))
-            finally:
-                # Schedule next refresh
-                self.root.after(REFRESH_INTERVAL * 1000, self.refresh_signals)
-        
-        # Run in background thread
-        threading.Thread(target=update_task, daemon=True).start()
+        """Fetch signals and publish a new snapshot (refresh thread only)"""
+        try:
+            start_time = time.time()
+            generation = self.config_generation
+            signals = self.signal_generator.get_all_signals()
+            update_time = datetime.now(pytz.utc)
+            next_refresh = update_time + timedelta(seconds=REFRESH_INTERVAL)
+            
+            # Hand the result to the Tk thread unless a reload made it stale
+            if not self.publish_state(signals, update_time, next_refresh, generation):
+                print("Discarded refresh computed before a config reload")
+                self.refresh_requested.set()
+                return
+            
+            # Queue alerts for the dispatcher thread
+            self.alerts.publish(signals)
+            
+            # Log performance
+            elapsed = time.time() - start_time
+            print(f"Signal refresh completed in {elapsed:.2f} seconds")
+            
+        except Exception as e:
+            self.state.report("Refresh Error", str(e))
 
     def manual_refresh(self):
         """Trigger manual refresh"""
         self.status_label.config(text="Status: Manual refresh requested...")
-        threading.Thread(target=self.refresh_signals, daemon=True).start()
+        self.refresh_requested.set()  # Repeated clicks coalesce into one refresh
+
+    def publish_state(self, signals, update_time, next_refresh, generation=None):
+        """Update worker-side state and publish an immutable snapshot
+
+        Signals computed under an older config generation are dropped and
+        False is returned.
+        """
+        with self.model_lock:
+            if generation is not None and generation != self.config_generation:
+                return False
+            
+            for pair, (signal, signal_time, _, _) in signals.items():
+                if signal in ("BUY", "SELL") and signal_time:
+                    open_time = int(signal_time.timestamp() * 1000)
+                    marks = self.signal_marks.get(pair, {})
+                    if open_time not in marks:
+                        self.signal_marks[pair] = freeze({**marks, open_time: signal})
+            
+            self.last_signals = signals
+            self.last_update = update_time
+            self.next_refresh = next_refresh
+            
+            with self.signal_generator.lock:
+                frames = freeze(self.signal_generator.latest_frames)
+                history = freeze(self.signal_generator.history_frames)
+            
+            self.state.publish(DashboardSnapshot(
+                seq=self.state.next_seq(),
+                config_generation=self.config_generation,
+                signals=freeze(signals),
+                update_time=update_time,
+                next_refresh=next_refresh,
+                active_signals=self.update_active_signals(signals),
+                stats=freeze(self.signal_generator.stats.snapshot()),
+                frames=frames,
+                history=history,
+                signal_marks=freeze(self.signal_marks),
+                strategy_text=self.get_strategy_text(),
+                trading_pairs=tuple(TRADING_PAIRS)
+            ))
+            return True
 
-    def update_ui(self, signals, update_time, next_refresh):
+    def process_state(self):
+        """Apply the newest snapshot on a fixed frame tick (Tk thread only)"""
+        snapshot, errors = self.state.drain(self.snapshot.seq if self.snapshot else 0)
+        if snapshot is not None:
+            self.snapshot = snapshot
+            self.update_ui(snapshot)
+        
+        # Reschedule first so a modal error dialog never stops the frame tick
+        self.root.after(UI_FRAME_MS, self.process_state)
+        
+        if errors:
+            self.status_label.config(text=f"Status: {errors[-1][0]}")
+            if not self.showing_error:
+                self.show_error(*errors[-1])
+
+    def update_ui(self, snapshot):
         """Update all UI elements with new data"""
         # Clear tables
         for tree in [self.pure_tree, self.confirm_tree]:
@@ -370,7 +548,7 @@ class TradingSignalDashboard:
                 tree.delete(item)
         
         # Update pure signals table
-        for pair, (signal, signal_time, direction, duration) in signals.items():
+        for pair, (signal, signal_time, direction, duration) in snapshot.signals.items():
             time_str = signal_time.strftime("%Y-%m-%d %H:%M:%S") if signal_time else "N/A"
             self.pure_tree.insert(
                 "", tk.END, 
@@ -388,23 +566,91 @@ class TradingSignalDashboard:
         
         # Update status bar
         self.update_label.config(
-            text=f"Last update: {update_time.strftime('%H:%M:%S UTC')}"
+            text=f"Last update: {snapshot.update_time.strftime('%H:%M:%S UTC')}"
         )
         self.next_label.config(
-            text=f"Next refresh: {next_refresh.strftime('%H:%M:%S UTC')}"
+            text=f"Next refresh: {snapshot.next_refresh.strftime('%H:%M:%S UTC')}"
         )
         self.candle_label.config(
             text=f"Next candle: {self.get_next_candle_time()}"
         )
+        self.status_label.config(text="Status: Ready")
+        
+        # Settings may have been reloaded
+        self.strategy_label.config(text=snapshot.strategy_text)
+        self.pair_box.config(values=snapshot.trading_pairs)
         
-        # Store for active signal tracking
-        self.last_signals = signals
-        self.last_update = update_time
+        self.update_active_table(snapshot.active_signals)
+        self.update_stats(snapshot.stats)
+        self.update_chart()
+
+    def update_stats(self, stats):
+        """Refresh rolling strategy statistics table"""
+        for item in self.stats_tree.get_children():
+            self.stats_tree.delete(item)
+        
+        for (pair, signal), summary in sorted(stats.items()):
+            if summary["trades"]:
+                values = (
+                    f"{summary['trades']}",
+                    f"{summary['win_rate']:.0%}",
+                    f"{summary['avg_run'] * 5:.0f} mins",
+                    f"{summary['expectancy']:+.2f}"
+                )
+                tag = 'PROFIT' if summary["expectancy"] > 0 else 'LOSS'
+            else:
+                values = ("0", "N/A", "N/A", "N/A")
+                tag = 'N/A'
+            self.stats_tree.insert(
+                "", tk.END,
+                values=(pair, signal) + values + (summary["open"],),
+                tags=(tag,)
+            )
+
+    def select_chart_pair(self):
+        """Backfill chart history for the selected pair, then redraw"""
+        pair = self.chart_pair.get()
+        if self.chart_panel is not None and pair not in self.history_requests:
+            history = self.snapshot.history.get(pair) if self.snapshot else None
+            frames = self.snapshot.frames.get(pair) if self.snapshot else None
+            
+            # Refetch once live candles no longer overlap the stored history
+            stale = history is None or (
+                frames is not None and history['open_time'].iloc[-1] < frames['open_time'].iloc[0]
+            )
+            if stale:
+                self.history_requests.add(pair)
+                threading.Thread(
+                    target=self.load_chart_history, args=(pair,), daemon=True
+                ).start()
+        self.update_chart()
+
+    def load_chart_history(self, pair):
+        """Fetch CHART_HISTORY candles and publish them (worker thread)"""
+        try:
+            if self.signal_generator.fetch_history(pair) is not None:
+                with self.model_lock:
+                    self.publish_state(self.last_signals, self.last_update, self.next_refresh)
+        except Exception as e:
+            self.state.report("Chart History Error", str(e))
+        finally:
+            self.history_requests.discard(pair)  # Allow a retry on the next selection
+
+    def update_chart(self):
+        """Push the latest candles of the selected pair to the chart"""
+        if self.chart_panel is None or self.snapshot is None:
+            return
+        pair = self.chart_pair.get()
+        self.chart_panel.update_data(
+            pair,
+            self.snapshot.frames.get(pair),
+            self.snapshot.signal_marks.get(pair, {}),
+            self.snapshot.history.get(pair)
+        )
 
     def update_active_signals(self, signals):
-        """Track and update active signals"""
+        """Track active signals and return table rows (worker side)"""
         current_time = datetime.now(pytz.utc)
-        new_signals = []
         
         # Add new signals
         for pair, (signal, signal_time, _, _) in signals.items():
@@ -414,7 +660,6 @@ class TradingSignalDashboard:
                     "entry_time": signal_time or current_time,
                     "status": "ACTIVE"
                 }
-                new_signals.append(pair)
         
         # Update existing signals
         for pair in list(self.active_signals.keys()):
@@ -432,30 +677,69 @@ class TradingSignalDashboard:
                 else:
                     signal_data["status"] = "CLOSED"
         
-        # Update table
-        for item in self.active_tree.get_children():
-            self.active_tree.delete(item)
-            
-        for pair, data in self.active_signals.items():
+        rows = []
+        for pair, data in list(self.active_signals.items()):
             duration = current_time - data["entry_time"]
             duration_str = str(duration).split('.')[0]  # Remove microseconds
-            
-            self.active_tree.insert(
-                "", tk.END,
-                values=(
-                    pair,
-                    data["signal"],
-                    data["entry_time"].strftime("%H:%M:%S"),
-                    duration_str,
-                    data["status"]
-                ),
-                tags=(data["status"],)
-            )
+            rows.append((
+                pair,
+                data["signal"],
+                data["entry_time"].strftime("%H:%M:%S"),
+                duration_str,
+                data["status"]
+            ))
             
             # Clean up closed signals
             if data["status"] in ("CLOSED", "LOSS", "PROFIT"):
-                if (current_time - data["entry_time"]) > timedelta(minutes=30):
+                if duration > timedelta(minutes=30):
                     del self.active_signals[pair]
+        return tuple(rows)
+
+    def update_active_table(self, rows):
+        """Render active signal rows"""
+        for item in self.active_tree.get_children():
+            self.active_tree.delete(item)
+            
+        for row in rows:
+            self.active_tree.insert("", tk.END, values=row, tags=(row[-1],))
+
+    def watch_config(self):
+        """Check config.py for changes on a timer"""
+        if self.config_watcher.changed_on_disk():
+            threading.Thread(target=self.reload_config, daemon=True).start()
+        self.root.after(CONFIG_POLL_INTERVAL * 1000, self.watch_config)
+
+    def reload_config(self):
+        """Reload settings and recompute only the affected signals"""
+        try:
+            # Bumping the generation with the reload makes in-flight refreshes stale
+            with self.model_lock, self.signal_generator.lock:
+                change = self.config_watcher.reload()
+                if change is None:
+                    return
+                self.config_generation += 1
+            signals = self.signal_generator.apply_config(change)
+            
+            # Merge recomputed signals into the last published ones
+            with self.model_lock:
+                merged = {}
+                for pair in TRADING_PAIRS:
+                    if pair in signals:
+                        merged[pair] = signals[pair]
+                    elif pair in self.last_signals:
+                        merged[pair] = self.last_signals[pair]
+                self.publish_state(merged, self.last_update, self.next_refresh)
+            self.alerts.publish(signals)
+        except Exception as e:
+            self.state.report("Config Reload Error", str(e))
+
+    def get_strategy_text(self):
+        """Header summary of the current strategy settings"""
+        return (
+            f"Strategy: RSI({RSI_PERIOD}) | "
+            f"MACD({MACD_FAST},{MACD_SLOW},{MACD_SIGNAL}) | "
+            f"Assets: {len(TRADING_PAIRS)} Pairs"
+        )
 
     def get_next_candle_time(self):
         """Calculate time until next candle"""
@@ -468,7 +752,11 @@ class TradingSignalDashboard:
 
     def show_error(self, title, message):
         """Show error message"""
-        messagebox.showerror(title, f"{message}\n\nApplication will continue running.")
+        self.showing_error = True
+        try:
+            messagebox.showerror(title, f"{message}\n\nApplication will continue running.")
+        finally:
+            self.showing_error = False
 
 # ==============================
 # APPLICATION ENTRY POINT
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# Market data providers with failover and hedged requests
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import requests
+from config import *
+
+MAX_KLINES_LIMIT = 1000  # Most candles one klines request returns
+
+
+class MarketDataError(Exception):
+    """No provider returned usable candles"""
+
+
+class KlinesProvider:
+    """Binance-compatible klines endpoint with its own symbol table"""
+
+    def __init__(self, name, url, symbols, timeout=10):
+        self.name = name
+        self.url = url
+        self.symbols = symbols
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.failures = 0
+
+    def supports(self, pair):
+        return pair in self.symbols
+
+    def fetch(self, pair, interval, limit, end_time=None):
+        """Request raw klines rows for a trading pair, optionally ending at end_time (ms)"""
+        params = {
+            'symbol': self.symbols[pair],
+            'interval': interval,
+            'limit': limit
+        }
+        if end_time is not None:
+            params['endTime'] = end_time
+        start = time.perf_counter()
+        try:
+            response = self.session.get(
+                self.url,
+                params=params,
+                headers={'Cache-Control': 'no-cache'},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+        if not isinstance(data, list):
+            self.failures += 1
+            raise MarketDataError(f"{self.name}: unexpected response {str(data)[:100]}")
+        self.failures = 0
+        return data
+
+    def latency_percentile(self, percentile):
+        """Observed latency at a percentile, or None without enough samples"""
+        samples = sorted(self.latencies)
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        idx = min(len(samples) - 1, int(len(samples) * percentile / 100))
+        return samples[idx]
+
+
+class MarketDataClient:
+    """Fetch klines with failover and latency-hedged duplicate requests"""
+
+    def __init__(self, providers=None, hedge_percentile=None):
+        if providers is None:
+            providers = [
+                KlinesProvider(p["name"], p["url"], p["symbols"])
+                for p in MARKET_DATA_PROVIDERS
+            ]
+        self.providers = providers
+        self.hedge_percentile = hedge_percentile
+        self.executor = ThreadPoolExecutor(
+            max_workers=MARKET_DATA_WORKERS,
+            thread_name_prefix="market-data"
+        )
+        self.lock = threading.Lock()
+        self.hedges = 0
+        self.failovers = 0
+
+    def update_symbols(self, provider_configs):
+        """Swap in reloaded symbol tables, matched to running providers by name"""
+        running = {provider.name: provider for provider in self.providers}
+        for config in provider_configs:
+            provider = running.get(config["name"])
+            if provider is None or provider.url != config["url"]:
+                print(f"Restart required for provider endpoint: {config['name']}")
+                continue
+            provider.symbols = dict(config["symbols"])
+
+    def supports(self, pair):
+        """True when at least one provider maps the pair"""
+        return any(p.supports(pair) for p in self.providers)
+
+    def candidates(self, pair):
+        """Providers mapping the pair, healthy ones first"""
+        supported = [p for p in self.providers if p.supports(pair)]
+        return sorted(supported, key=lambda p: p.failures > 0)
+
+    def hedge_delay(self, provider):
+        """How long to wait on a provider before duplicating the request"""
+        # HEDGE_PERCENTILE is read per call so config reloads apply
+        percentile = HEDGE_PERCENTILE if self.hedge_percentile is None else self.hedge_percentile
+        latency = provider.latency_percentile(percentile)
+        if latency is None:
+            return HEDGE_DEFAULT_DELAY
+        return min(max(latency, HEDGE_MIN_DELAY), provider.timeout)
+
+    def fetch_klines(self, pair, interval, limit, end_time=None):
+        """Return raw klines rows from whichever provider answers first"""
+        candidates = self.candidates(pair)
+        if not candidates:
+            raise MarketDataError(f"No market data provider maps {pair}")
+
+        pending = {}
+        errors = []
+        next_idx = 0
+
+        def submit():
+            nonlocal next_idx
+            provider = candidates[next_idx]
+            next_idx += 1
+            pending[self.executor.submit(provider.fetch, pair, interval, limit, end_time)] = provider
+            return provider
+
+        last = submit()
+        while pending:
+            # Only arm the hedge timer while another provider is left
+            timeout = self.hedge_delay(last) if next_idx < len(candidates) else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                last = submit()
+                with self.lock:
+                    self.hedges += 1
+                continue
+
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    errors.append(f"{provider.name}: {str(e)}")
+
+            # Fail over immediately instead of waiting for the hedge timer
+            if next_idx < len(candidates):
+                last = submit()
+                with self.lock:
+                    self.failovers += 1
+
+        raise MarketDataError("; ".join(errors))
+
+
+def self_check():
+    """Check hedging and failover against local mock exchanges"""
+    from mock_exchange import start_mock_server
+
+    symbols = {"BTC/USD": "BTCUSDT"}
+    fast = start_mock_server()
+    slow = start_mock_server(latency=f"const:{HEDGE_DEFAULT_DELAY * 2}")
+    dead = start_mock_server()
+    dead.shutdown()
+    dead.server_close()  # Connections to it are refused
+
+    def provider(name, server):
+        url = f"http://127.0.0.1:{server.server_address[1]}/api/v3/klines"
+        return KlinesProvider(name, url, symbols, timeout=HEDGE_DEFAULT_DELAY * 5)
+
+    # A slow primary is hedged after HEDGE_DEFAULT_DELAY and the backup wins
+    client = MarketDataClient([provider("slow", slow), provider("fast", fast)])
+    start = time.perf_counter()
+    rows = client.fetch_klines("BTC/USD", "5m", 10)
+    elapsed = time.perf_counter() - start
+    assert len(rows) == 10, rows
+    assert client.hedges == 1 and client.failovers == 0, (client.hedges, client.failovers)
+    assert elapsed < HEDGE_DEFAULT_DELAY * 1.5, elapsed
+    print(f"Slow primary hedged: {elapsed:.2f}s")
+
+    # A dead primary fails over at once, without waiting for the hedge timer
+    client = MarketDataClient([provider("dead", dead), provider("fast", fast)])
+    start = time.perf_counter()
+    rows = client.fetch_klines("BTC/USD", "5m", 10)
+    elapsed = time.perf_counter() - start
+    assert len(rows) == 10, rows
+    assert client.failovers == 1 and client.hedges == 0, (client.hedges, client.failovers)
+    assert elapsed < HEDGE_DEFAULT_DELAY, elapsed
+    assert client.candidates("BTC/USD")[0].name == "fast"  # Failed provider is tried last
+    print(f"Dead primary failed over: {elapsed:.2f}s")
+
+    # Every provider down raises MarketDataError with each provider's error
+    client = MarketDataClient([provider("dead", dead)])
+    try:
+        client.fetch_klines("BTC/USD", "5m", 10)
+    except MarketDataError as e:
+        assert "dead:" in str(e), e
+    else:
+        raise AssertionError("expected MarketDataError")
+    print("All providers down: MarketDataError raised")
+
+    fast.shutdown()
+    slow.shutdown()
+
+
+if __name__ == "__main__":
+    # python market_data.py  -- hedging and failover check, no network needed
+    self_check()
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+# Offline mock of the klines and Pocket Option endpoints
+#
+# Serves deterministic generated (or replayed) candles plus login/trade/balance
+# with configurable latency, error rate and Binance-style rate limiting.
+#
+#   python mock_exchange.py --port 8081 --latency lognormal:-3,0.6 \
+#       --tail-rate 0.02 --tail-latency uniform:1,3 --error-rate 0.01
+#
+# Then point MARKET_DATA_PROVIDERS at http://127.0.0.1:8081/api/v3/klines
+# and PO_API_URL at http://127.0.0.1:8081/api
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+INTERVAL_MS = {
+    "1m": 60000, "3m": 180000, "5m": 300000, "15m": 900000, "30m": 1800000,
+    "1h": 3600000, "4h": 14400000, "1d": 86400000
+}
+WEIGHT_WINDOW = 60  # Seconds per rate-limit window, like X-MBX-USED-WEIGHT-1M
+
+
+def parse_latency(spec):
+    """Build a latency sampler from 'const:s', 'uniform:a,b', 'normal:mu,sd' or 'lognormal:mu,sigma'"""
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",")] if args else []
+    if kind == "const":
+        return lambda rng: values[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return lambda rng: rng.lognormvariate(values[0], values[1])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def klines_weight(limit):
+    """Request weight Binance charges for a klines call"""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+class MockExchange:
+    """State and behaviour shared by all request handlers"""
+
+    def __init__(self, seed=42, latency="const:0", tail_rate=0.0, tail_latency="const:0",
+                 error_rate=0.0, weight_limit=1200, replay=None, frozen_time=None,
+                 symbols=None, balance=1000.0):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.latency = parse_latency(latency)
+        self.tail_rate = tail_rate
+        self.tail_latency = parse_latency(tail_latency)
+        self.error_rate = error_rate
+        self.weight_limit = weight_limit
+        self.replay = replay or {}
+        self.frozen_time = frozen_time
+        self.symbols = set(symbols) if symbols else None
+        self.start_balance = balance
+        self.sessions = {}   # token -> account
+        self.weight_window = 0
+        self.weight_used = 0
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def now(self):
+        return self.frozen_time if self.frozen_time is not None else time.time()
+
+    def sample_delay(self):
+        with self.rng_lock:
+            delay = self.latency(self.rng)
+            if self.rng.random() < self.tail_rate:
+                delay += self.tail_latency(self.rng)
+            fail = self.rng.random() < self.error_rate
+        return delay, fail
+
+    def charge_weight(self, weight):
+        """Add request weight; returns (allowed, used, retry_after)"""
+        with self.lock:
+            self.requests += 1
+            now = time.time()
+            window = int(now // WEIGHT_WINDOW)
+            if window != self.weight_window:
+                self.weight_window = window
+                self.weight_used = 0
+            retry_after = int((window + 1) * WEIGHT_WINDOW - now) + 1
+            if self.weight_limit and self.weight_used + weight > self.weight_limit:
+                return False, self.weight_used, retry_after
+            self.weight_used += weight
+            return True, self.weight_used, retry_after
+
+    def candle(self, symbol, index, interval_ms):
+        """Deterministic OHLCV for a candle index; no state between requests"""
+        base = 10 ** (1 + (sum(map(ord, symbol)) % 4))
+
+        def close_at(k):
+            noise = random.Random(f"{self.seed}:{symbol}:{k}").gauss(0, 1)
+            return base * (1 + 0.01 * math.sin(k / 20.0) + 0.004 * math.sin(k / 6.3) + 0.0015 * noise)
+
+        rng = random.Random(f"{self.seed}:{symbol}:{index}:hl")
+        open_price = close_at(index - 1)
+        close = close_at(index)
+        high = max(open_price, close) * (1 + abs(rng.gauss(0, 0.0008)))
+        low = min(open_price, close) * (1 - abs(rng.gauss(0, 0.0008)))
+        volume = rng.uniform(10, 1000)
+        open_time = index * interval_ms
+        return [
+            open_time, f"{open_price:.6f}", f"{high:.6f}", f"{low:.6f}", f"{close:.6f}",
+            f"{volume:.4f}", open_time + interval_ms - 1, f"{volume * close:.4f}",
+            rng.randint(10, 500), f"{volume / 2:.4f}", f"{volume * close / 2:.4f}", "0"
+        ]
+
+    def klines(self, symbol, interval, limit, end_time=None):
+        if symbol in self.replay:
+            rows = self.replay[symbol]
+            if end_time is not None:
+                rows = [row for row in rows if row[0] <= end_time]
+            return rows[-limit:]
+        interval_ms = INTERVAL_MS[interval]
+        end_ms = end_time if end_time is not None else self.now() * 1000
+        last = int(end_ms // interval_ms)
+        return [self.candle(symbol, idx, interval_ms) for idx in range(last - limit + 1, last + 1)]
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """Route requests to the MockExchange attached to the server"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # Headers and body go out in separate writes
+    verbose = False
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def handle_request(self, method):
+        exchange = self.server.exchange
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body = self.read_json()
+
+        routes = {
+            ("GET", "/api/v3/klines"): self.get_klines,
+            ("POST", "/api/login"): self.post_login,
+            ("POST", "/api/trade"): self.post_trade,
+            ("GET", "/api/balance"): self.get_balance
+        }
+        route = routes.get((method, url.path))
+        if route is None:
+            return self.send_json(404, {"code": -1, "msg": "Not found"})
+
+        weight = 1
+        if route == self.get_klines:
+            # Parse numeric parameters once; bad values get a Binance-style 400
+            try:
+                query["limit"] = int(query.get("limit", 500))
+                if "endTime" in query:
+                    query["endTime"] = int(query["endTime"])
+            except ValueError:
+                return self.send_json(400, {"code": -1100, "msg": "Illegal characters found in parameter."})
+            weight = klines_weight(query["limit"])
+        allowed, used, retry_after = exchange.charge_weight(weight)
+        headers = {"X-MBX-USED-WEIGHT-1M": str(used)}
+        if not allowed:
+            headers["Retry-After"] = str(retry_after)
+            return self.send_json(429, {"code": -1003, "msg": "Too many requests"}, headers)
+
+        delay, fail = exchange.sample_delay()
+        time.sleep(delay)
+        if fail:
+            return self.send_json(500, {"code": -1000, "msg": "Injected error"}, headers)
+        route(query, body, headers)
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+        # Handlers expect an object; arrays and scalars count as no body
+        return body if isinstance(body, dict) else {}
+
+    def send_json(self, status, payload, headers=None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def account(self):
+        cookie = self.headers.get("Cookie", "")
+        for part in cookie.split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == "session":
+                exchange = self.server.exchange
+                with exchange.lock:
+                    return exchange.sessions.get(value)
+        return None
+
+    def get_klines(self, query, body, headers):
+        exchange = self.server.exchange
+        symbol = query.get("symbol", "")
+        interval = query.get("interval", "5m")
+        if not symbol or (exchange.symbols and symbol not in exchange.symbols):
+            return self.send_json(400, {"code": -1121, "msg": "Invalid symbol."}, headers)
+        if interval not in INTERVAL_MS:
+            return self.send_json(400, {"code": -1120, "msg": "Invalid interval."}, headers)
+        limit = min(max(query["limit"], 1), 1000)
+        end_time = query.get("endTime")
+        self.send_json(200, exchange.klines(symbol, interval, limit, end_time), headers)
+
+    def post_login(self, query, body, headers):
+        exchange = self.server.exchange
+        if not body.get("email") or not body.get("password"):
+            return self.send_json(401, {"success": False, "message": "Invalid credentials"}, headers)
+        with exchange.rng_lock:
+            token = uuid.UUID(int=exchange.rng.getrandbits(128)).hex
+        with exchange.lock:
+            exchange.sessions[token] = {"email": body["email"], "balance": exchange.start_balance, "trades": 0}
+        headers["Set-Cookie"] = f"session={token}; Path=/"
+        self.send_json(200, {"success": True, "token": token}, headers)
+
+    def post_trade(self, query, body, headers):
+        account = self.account()
+        if account is None:
+            return self.send_json(401, {"success": False, "message": "Not logged in"}, headers)
+        try:
+            amount = float(body.get("amount", 0))
+        except (TypeError, ValueError):
+            amount = 0
+        if body.get("direction") not in ("call", "put", "buy", "sell") or amount <= 0:
+            return self.send_json(400, {"success": False, "message": "Invalid trade"}, headers)
+
+        # Concurrent trades on one session must not lose updates
+        with self.server.exchange.lock:
+            if amount > account["balance"]:
+                trade_id = None
+            else:
+                account["balance"] -= amount
+                account["trades"] += 1
+                trade_id = account["trades"]
+        if trade_id is None:
+            return self.send_json(400, {"success": False, "message": "Insufficient balance"}, headers)
+        self.send_json(200, {
+            "success": True,
+            "trade_id": trade_id,
+            "message": f"{body['direction']} {body.get('asset')} {amount:.2f} for {body.get('duration')}s"
+        }, headers)
+
+    def get_balance(self, query, body, headers):
+        account = self.account()
+        if account is None:
+            return self.send_json(401, {"success": False, "message": "Not logged in"}, headers)
+        with self.server.exchange.lock:
+            balance = account["balance"]
+        self.send_json(200, {"balance": round(balance, 2)}, headers)
+
+
+def start_mock_server(host="127.0.0.1", port=0, verbose=False, **options):
+    """Start a mock exchange on a background thread; returns the server"""
+    server = ThreadingHTTPServer((host, port), MockRequestHandler)
+    server.daemon_threads = True
+    server.exchange = MockExchange(**options)
+    MockRequestHandler.verbose = verbose
+    threading.Thread(target=server.serve_forever, name="mock-exchange", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline mock exchange server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency", default="const:0",
+                        help="const:s | uniform:a,b | normal:mu,sd | lognormal:mu,sigma (seconds)")
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="Share of slow responses")
+    parser.add_argument("--tail-latency", default="const:0", help="Extra delay for slow responses")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of HTTP 500 responses")
+    parser.add_argument("--weight-limit", type=int, default=1200, help="Request weight per minute, 0 = unlimited")
+    parser.add_argument("--replay", help="JSON file mapping symbol to recorded klines rows")
+    parser.add_argument("--frozen-time", type=float, help="Serve candles as of this epoch time")
+    parser.add_argument("--symbols", nargs="*", help="Only accept these symbols")
+    parser.add_argument("--balance", type=float, default=1000.0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    replay = None
+    if args.replay:
+        with open(args.replay, encoding="utf-8") as f:
+            replay = json.load(f)
+
+    server = start_mock_server(
+        args.host, args.port, verbose=args.verbose, seed=args.seed,
+        latency=args.latency, tail_rate=args.tail_rate, tail_latency=args.tail_latency,
+        error_rate=args.error_rate, weight_limit=args.weight_limit, replay=replay,
+        frozen_time=args.frozen_time, symbols=args.symbols, balance=args.balance
+    )
+    print(f"Mock exchange listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,12 @@
 # Note: Official API not available - requires custom implementation
 
 import requests
-from config import PO_EMAIL, PO_PASSWORD
+from config import PO_API_URL, PO_EMAIL, PO_PASSWORD
 
 class PocketOptionAPI:
-    def __init__(self):
+    def __init__(self, base_url=None):
         self.session = requests.Session()
-        self.base_url = "https://pocketoption.com/api"
+        self.base_url = base_url or PO_API_URL
         self.is_logged_in = False
         
     def login(self, email=None, password=None):
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Monte Carlo drawdown and ruin risk of trading the generated signals
+#
+#   python risk_simulator.py --journal signal_journal.csv --paths 1000000
+#   python risk_simulator.py --win-rate 0.56 --stake 10 --balance 500
+
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from config import *
+
+SCHEMES = ("fixed", "fraction", "martingale", "kelly")
+MIN_STAKE = 1.0  # Smallest trade the broker accepts
+
+
+def load_outcomes(path, pair=None, direction=None):
+    """Read settled signal results from the journal as +1 win, -1 loss, 0 draw"""
+    codes = {"WIN": 1, "LOSS": -1, "DRAW": 0}
+    outcomes = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if pair and row["pair"] != pair:
+                continue
+            if direction and row["direction"] != direction:
+                continue
+            outcomes.append(codes[row["result"]])
+    return np.array(outcomes, dtype=np.int8)
+
+
+def kelly_fraction(outcomes, payout):
+    """Kelly stake fraction for the empirical win rate, zero when there is no edge"""
+    wins = np.count_nonzero(outcomes > 0)
+    losses = np.count_nonzero(outcomes < 0)
+    if not wins + losses:
+        return 0.0
+    p = wins / (wins + losses)
+    return max(0.0, (p * payout - (1 - p)) / payout)
+
+
+def simulate_batch(outcomes, n_paths, n_trades, scheme, params, seed):
+    """Simulate one batch of equity paths; returns (max drawdown, final balance)"""
+    rng = np.random.default_rng(seed)
+    payout = params["payout"]
+
+    # Profit per unit stake for each resampled trade, one contiguous row per trade
+    factors = np.where(outcomes > 0, payout, np.where(outcomes < 0, -1.0, 0.0))
+    draws = factors[rng.integers(0, len(outcomes), size=(n_trades, n_paths), dtype=np.int32)]
+
+    balance = np.full(n_paths, params["balance"])
+    peak = balance.copy()
+    max_dd = np.zeros(n_paths)
+    streak = np.zeros(n_paths, dtype=np.int32)
+    stake = np.empty(n_paths)
+    drawdown = np.empty(n_paths)
+
+    for t in range(n_trades):
+        if scheme == "fixed":
+            stake.fill(params["stake"])
+        elif scheme == "fraction":
+            np.multiply(balance, params["fraction"], out=stake)
+        elif scheme == "martingale":
+            np.multiply(params["stake"], np.left_shift(1, streak), out=stake)
+        else:
+            np.multiply(balance, params["kelly"], out=stake)
+
+        # Respect the broker minimum; ruined paths stop trading
+        if scheme != "kelly" or params["kelly"] > 0:
+            np.maximum(stake, MIN_STAKE, out=stake)
+        np.minimum(stake, balance, out=stake)
+        stake[balance < MIN_STAKE] = 0.0
+
+        result = draws[t]
+        balance += stake * result
+        if scheme == "martingale":
+            # Double after a loss, back to base after a win or the last step
+            streak = np.where(result < 0, streak + 1, 0)
+            streak[streak > params["martingale_steps"]] = 0
+
+        np.maximum(peak, balance, out=peak)
+        np.divide(balance, peak, out=drawdown)
+        np.subtract(1.0, drawdown, out=drawdown)
+        np.maximum(max_dd, drawdown, out=max_dd)
+
+    return max_dd.astype(np.float32), balance.astype(np.float32)
+
+
+def run_simulation(outcomes, scheme, params, n_paths, n_trades, batch_size, workers, seed):
+    """Spread batches over a process pool and join the results"""
+    n_batches = -(-n_paths // batch_size)
+    sizes = [batch_size] * (n_batches - 1) + [n_paths - batch_size * (n_batches - 1)]
+    seeds = np.random.SeedSequence(seed).spawn(n_batches)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(
+            simulate_batch,
+            [outcomes] * n_batches, sizes, [n_trades] * n_batches,
+            [scheme] * n_batches, [params] * n_batches, seeds
+        ))
+    max_dd = np.concatenate([r[0] for r in results])
+    final = np.concatenate([r[1] for r in results])
+    return max_dd, final
+
+
+def summarize(max_dd, final):
+    """Drawdown, ruin and final balance statistics"""
+    return {
+        "ruin": float(np.mean(final < MIN_STAKE)),
+        "drawdown": {p: float(np.percentile(max_dd, p)) for p in (50, 90, 95, 99)},
+        "final": {p: float(np.percentile(final, p)) for p in (5, 25, 50, 75, 95)},
+        "mean_final": float(np.mean(final))
+    }
+
+
+def print_report(name, summary, elapsed):
+    dd = summary["drawdown"]
+    final = summary["final"]
+    print(f"\n{name}  ({elapsed:.1f}s)")
+    print(f"  Probability of ruin : {summary['ruin']:.2%}")
+    print("  Max drawdown        : " + "  ".join(f"p{p} {v:.1%}" for p, v in dd.items()))
+    print("  Final balance       : " + "  ".join(f"p{p} {v:,.2f}" for p, v in final.items()))
+    print(f"  Mean final balance  : {summary['mean_final']:,.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo risk simulation of signal streams")
+    parser.add_argument("--journal", default=STATS_JOURNAL_FILE, help="Settled signal journal (CSV)")
+    parser.add_argument("--pair", help="Only use outcomes for this pair")
+    parser.add_argument("--direction", choices=("BUY", "SELL"))
+    parser.add_argument("--win-rate", type=float, help="Simulate a fixed win rate instead of the journal")
+    parser.add_argument("--payout", type=float, default=PAYOUT)
+    parser.add_argument("--balance", type=float, default=1000.0)
+    parser.add_argument("--stake", type=float, default=10.0, help="Stake for fixed and martingale")
+    parser.add_argument("--fraction", type=float, default=0.02, help="Balance share for fraction")
+    parser.add_argument("--martingale-steps", type=int, default=4, help="Max doublings after losses")
+    parser.add_argument("--kelly-scale", type=float, default=0.5, help="Share of full Kelly to stake")
+    parser.add_argument("--schemes", nargs="+", choices=SCHEMES, default=list(SCHEMES))
+    parser.add_argument("--trades", type=int, default=200, help="Trades per path")
+    parser.add_argument("--paths", type=int, default=1000000)
+    parser.add_argument("--batch-size", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.win_rate is not None:
+        # Parametric Monte Carlo: 10,000 outcomes approximate the win rate closely
+        wins = int(round(args.win_rate * 10000))
+        outcomes = np.array([1] * wins + [-1] * (10000 - wins), dtype=np.int8)
+        source = f"win rate {args.win_rate:.1%}"
+    elif args.journal and os.path.exists(args.journal):
+        outcomes = load_outcomes(args.journal, args.pair, args.direction)
+        source = f"{len(outcomes)} journal outcomes from {args.journal}"
+    else:
+        parser.error("no journal found; pass --journal or --win-rate")
+    if not len(outcomes):
+        parser.error("no outcomes to resample")
+
+    params = {
+        "payout": args.payout,
+        "balance": args.balance,
+        "stake": args.stake,
+        "fraction": args.fraction,
+        "martingale_steps": args.martingale_steps,
+        "kelly": kelly_fraction(outcomes, args.payout) * args.kelly_scale
+    }
+    wins = np.count_nonzero(outcomes > 0) / len(outcomes)
+    print(f"Bootstrapping {source} (win rate {wins:.1%}, payout {args.payout:.0%})")
+    print(f"{args.paths:,} paths x {args.trades} trades, start balance {args.balance:,.2f}")
+
+    labels = {
+        "fixed": f"Fixed stake {args.stake:,.2f}",
+        "fraction": f"Fixed fraction {args.fraction:.1%}",
+        "martingale": f"Martingale from {args.stake:,.2f}, {args.martingale_steps} steps",
+        "kelly": f"{args.kelly_scale:g}x Kelly ({params['kelly']:.2%} of balance)"
+    }
+    for scheme in args.schemes:
+        start = time.perf_counter()
+        # Same seed per scheme so every scheme sees the same outcome paths
+        max_dd, final = run_simulation(
+            outcomes, scheme, params, args.paths, args.trades,
+            args.batch_size, args.workers, args.seed
+        )
+        print_report(labels[scheme], summarize(max_dd, final), time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
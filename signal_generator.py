@@ -1,41 +1,34 @@
 # -*- coding: utf-8 -*-
 import pandas as pd
 import numpy as np
-import requests
+import threading
 import time
 from datetime import datetime, timedelta
 import pytz
+from market_data import MarketDataClient, MarketDataError, MAX_KLINES_LIMIT
+from strategy_stats import StrategyStats
 from config import *
 
 class TradingSignalGenerator:
     def __init__(self):
-        self.base_url = API_URL
+        self.data_client = MarketDataClient()
         self.last_fetch_time = {}
-        
-    def fetch_data(self, symbol):
-        """Retrieve market data from API"""
-        # Construct symbol for Binance API
-        binance_symbol = symbol.replace("/", "")
-        if "/" in symbol:  # Crypto pairs
-            binance_symbol += "T"
-        
-        params = {
-            'symbol': binance_symbol,
-            'interval': TIMEFRAME,
-            'limit': MAX_CANDLES
-        }
-        
+        self.latest_frames = {}  # Last analysed candles per pair for charting
+        self.history_frames = {}  # Backfilled candles per charted pair
+        self.stats = StrategyStats()
+        self.lock = threading.RLock()  # Guards cached frames during config reloads
+        self.report_unmapped(TRADING_PAIRS)
+        
+    def report_unmapped(self, pairs):
+        """Log pairs no market data provider maps; they are shown as NO DATA"""
+        unmapped = [pair for pair in pairs if not self.data_client.supports(pair)]
+        if unmapped:
+            print(f"No market data provider maps: {', '.join(unmapped)}")
+
+    def fetch_data(self, symbol, limit=None, end_time=None):
+        """Retrieve market data from the configured providers"""
         try:
-            # Add cache busting to avoid stale data
-            cache_param = int(time.time() * 1000)
-            response = requests.get(
-                self.base_url, 
-                params=params,
-                headers={'Cache-Control': 'no-cache'},
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self.data_client.fetch_klines(symbol, TIMEFRAME, limit or MAX_CANDLES, end_time)
             
             if not data or len(data) < 30:
                 print(f"Insufficient data for {symbol}")
@@ -57,12 +50,36 @@ class TradingSignalGenerator:
             # Clean and return
             return df.dropna().reset_index(drop=True)
             
-        except requests.exceptions.RequestException as e:
-            print(f"Network error ({symbol}): {str(e)}")
+        except MarketDataError as e:
+            print(f"Market data error ({symbol}): {str(e)}")
         except Exception as e:
             print(f"Processing error ({symbol}): {str(e)}")
         return None
 
+    def fetch_history(self, pair, bars=None):
+        """Backfill up to `bars` (default CHART_HISTORY) candles with indicators for the chart"""
+        pages = []
+        end_time = None
+        remaining = bars or CHART_HISTORY
+        while remaining > 0:
+            limit = min(remaining, MAX_KLINES_LIMIT)
+            df = self.fetch_data(pair, limit, end_time)
+            if df is None:
+                break
+            pages.insert(0, df)
+            remaining -= len(df)
+            if len(df) < limit:
+                break  # Provider has no older candles
+            end_time = int(df['open_time'].iloc[0]) - 1
+        if not pages:
+            return None
+        
+        df = pd.concat(pages, ignore_index=True).drop_duplicates('open_time')
+        df = self.calculate_macd(self.calculate_rsi(df.reset_index(drop=True)))
+        with self.lock:
+            self.history_frames[pair] = df
+        return df
+
     def calculate_rsi(self, df):
         """Calculate Relative Strength Index with smoothing"""
         delta = df['close'].diff(1)
@@ -75,6 +92,7 @@ class TradingSignalGenerator:
         
         rs = avg_gain / avg_loss
         df['rsi'] = 100 - (100 / (1 + rs))
+        df.attrs['rsi_period'] = RSI_PERIOD  # Lets the chart spot stale indicator values
         return df
 
     def calculate_macd(self, df):
@@ -85,6 +103,7 @@ class TradingSignalGenerator:
         df['macd'] = ema_fast - ema_slow
         df['signal'] = df['macd'].ewm(span=MACD_SIGNAL, adjust=False).mean()
         df['histogram'] = df['macd'] - df['signal']
+        df.attrs['macd_periods'] = (MACD_FAST, MACD_SLOW, MACD_SIGNAL)
         return df
 
     def generate_signal(self, df, pair):
@@ -95,7 +114,14 @@ class TradingSignalGenerator:
         # Calculate indicators
         df = self.calculate_rsi(df)
         df = self.calculate_macd(df)
+        self.latest_frames[pair] = df
         
+        # Settle earlier signals against newly closed candles
+        self.stats.on_candles(pair, df)
+        return self.evaluate_signal(df, pair)
+
+    def evaluate_signal(self, df, pair):
+        """Apply signal rules to candles with indicators already calculated"""
         # Use last 3 candles for confirmation
         last_row = df.iloc[-1]
         prev_row = df.iloc[-2]
@@ -135,60 +161,89 @@ class TradingSignalGenerator:
         else:
             return "HOLD", None, None, None
         
+        # Track realized outcome; paused pairs keep being tracked so they can recover
+        self.stats.record_signal(pair, signal_type, last_row['open_time'], last_row['close'])
+        if STATS_PAUSE_ENABLED and self.stats.is_underperforming(pair, signal_type):
+            return "PAUSED", signal_time, None, None
+        
         # Signal confirmation and duration analysis
-        direction, duration = self.analyze_trade_duration(df, signal_type)
+        direction, duration = self.analyze_trade_duration(df, signal_type, pair)
         return signal_type, signal_time, direction, duration
 
-    def analyze_trade_duration(self, df, signal_type):
+    def analyze_trade_duration(self, df, signal_type, pair=None):
         """Analyze trade duration and confirmation"""
         if len(df) < 3:
             return "N/A", "N/A"
         
-        signal_idx = len(df) - 1
-        signal_close = df.iloc[signal_idx]['close']
-        
-        # Check next candle
-        next_idx = min(signal_idx + 1, len(df) - 1)
-        next_candle = df.iloc[next_idx]
-        next_close = next_candle['close']
-        
-        # Determine if next candle confirms signal
-        direction_match = (
-            (signal_type == "BUY" and next_close > signal_close) or 
-            (signal_type == "SELL" and next_close < signal_close)
-        )
-        
-        if not direction_match:
-            return "REVERSED", "Immediate"
-        
-        # Calculate duration until reversal
-        duration = 1
-        for i in range(signal_idx + 2, min(signal_idx + 10, len(df))):
-            current_close = df.iloc[i]['close']
-            prev_close = df.iloc[i-1]['close']
-            
-            reversal_condition = (
-                (signal_type == "BUY" and current_close < prev_close) or
-                (signal_type == "SELL" and current_close > prev_close)
-            )
-            
-            if reversal_condition:
-                break
-            duration += 1
-        
-        # Convert to time (5 min per candle)
-        minutes = duration * 5
-        return "CONFIRMED", f"{minutes} mins"
+        # The signal is on the newest candle, so no later candle can confirm
+        # it yet; report the live average run instead. Realized confirmation
+        # and run length are tracked by StrategyStats as candles close.
+        summary = self.stats.get(pair, signal_type)
+        if summary["avg_run"] is None:
+            return "PENDING", "N/A"
+        return "PENDING", f"~{summary['avg_run'] * 5:.0f} mins avg"
 
     def get_all_signals(self):
         """Generate signals for all trading pairs"""
         signals = {}
         for pair in TRADING_PAIRS:
+            # Unmapped pairs were reported once; skip the request and the delay
+            if not self.data_client.supports(pair):
+                signals[pair] = ("NO DATA", None, None, None)
+                continue
             try:
                 df = self.fetch_data(pair)
-                signals[pair] = self.generate_signal(df, pair)
+                with self.lock:
+                    signals[pair] = self.generate_signal(df, pair)
                 time.sleep(0.15)  # Avoid rate limiting
             except Exception as e:
                 print(f"Error processing {pair}: {str(e)}")
                 signals[pair] = ("ERROR", None, None, None)
         return signals
+
+    def apply_config(self, change):
+        """Recompute only what a config change affects, using cached candles"""
+        signals = {}
+        if "MARKET_DATA_PROVIDERS" in change.changed:
+            self.data_client.update_symbols(MARKET_DATA_PROVIDERS)
+        
+        with self.lock:
+            for pair in change.removed_pairs:
+                self.latest_frames.pop(pair, None)
+                self.history_frames.pop(pair, None)
+            
+            if change.rules:
+                for pair in TRADING_PAIRS:
+                    df = self.latest_frames.get(pair)
+                    if df is None or pair in change.added_pairs:
+                        continue
+                    
+                    # Copy so readers of the cached frame never see partial updates
+                    if change.indicators:
+                        df = df.copy()
+                        if "rsi" in change.indicators:
+                            df = self.calculate_rsi(df)
+                        if "macd" in change.indicators:
+                            df = self.calculate_macd(df)
+                        self.latest_frames[pair] = df
+                    signals[pair] = self.evaluate_signal(df, pair)
+            
+            # Chart history is recomputed as a new frame so the chart reloads it
+            if change.indicators:
+                for pair, df in list(self.history_frames.items()):
+                    self.history_frames[pair] = self.calculate_macd(self.calculate_rsi(df.copy()))
+        
+        # Only newly added pairs hit the network
+        self.report_unmapped(change.added_pairs)
+        for pair in change.added_pairs:
+            if not self.data_client.supports(pair):
+                signals[pair] = ("NO DATA", None, None, None)
+                continue
+            try:
+                df = self.fetch_data(pair)
+                with self.lock:
+                    signals[pair] = self.generate_signal(df, pair)
+            except Exception as e:
+                print(f"Error processing {pair}: {str(e)}")
+                signals[pair] = ("ERROR", None, None, None)
+        return signals
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Online strategy-quality statistics per pair and direction
+
+import csv
+import os
+import threading
+import time
+from collections import deque
+import numpy as np
+from config import *
+
+
+class RollingWindow:
+    """Fixed-size window of settled trades with running sums"""
+
+    def __init__(self, size):
+        self.trades = deque()
+        self.size = size
+        self.wins = 0
+        self.run_total = 0
+        self.pnl_total = 0.0
+
+    def add(self, win, run_length, pnl):
+        """Add a settled trade in O(1), evicting the oldest when full"""
+        self.trades.append((win, run_length, pnl))
+        self.wins += win
+        self.run_total += run_length
+        self.pnl_total += pnl
+        if len(self.trades) > self.size:
+            old_win, old_run, old_pnl = self.trades.popleft()
+            self.wins -= old_win
+            self.run_total -= old_run
+            self.pnl_total -= old_pnl
+
+    def summary(self):
+        count = len(self.trades)
+        if not count:
+            return {"trades": 0, "win_rate": None, "avg_run": None, "expectancy": None}
+        return {
+            "trades": count,
+            "win_rate": self.wins / count,
+            "avg_run": self.run_total / count,
+            "expectancy": self.pnl_total / count
+        }
+
+
+class StrategyStats:
+    """Track realized signal results as later candles arrive"""
+
+    def __init__(self, window=STATS_WINDOW, payout=PAYOUT,
+                 expiry_candles=STATS_EXPIRY_CANDLES, max_run=STATS_MAX_RUN):
+        self.window = window
+        self.payout = payout
+        self.expiry_candles = expiry_candles
+        self.max_run = max_run
+        self.open_trades = {}   # pair -> list of unsettled signals
+        self.last_candle = {}   # pair -> open_time of last processed closed candle
+        self.windows = {}       # (pair, direction) -> RollingWindow
+        self.lock = threading.Lock()
+        self.journal_lock = threading.Lock()
+
+    def record_signal(self, pair, direction, open_time, entry_price):
+        """Start tracking a BUY/SELL signal, once per signal candle"""
+        with self.lock:
+            trades = self.open_trades.setdefault(pair, [])
+            if any(trade["open_time"] == open_time for trade in trades):
+                return
+            trades.append({
+                "direction": direction,
+                "open_time": open_time,
+                "entry": entry_price,
+                "last_close": entry_price,
+                "candles": 0,
+                "run": 0,
+                "running": True,
+                "move": None
+            })
+
+    def on_candles(self, pair, df):
+        """Feed closed candles not yet seen for a pair"""
+        if df is None or len(df) == 0:
+            return
+        now_ms = time.time() * 1000
+        open_times = df['open_time'].to_numpy()
+        closed = int(np.searchsorted(df['close_time'].to_numpy(), now_ms))
+
+        settled = []
+        with self.lock:
+            last = self.last_candle.get(pair)
+            if last is None:
+                # Nothing before the first refresh needs replaying
+                if closed:
+                    self.last_candle[pair] = open_times[closed - 1]
+                return
+            start = int(np.searchsorted(open_times, last, side='right'))
+            closes = df['close'].to_numpy()
+            for idx in range(start, closed):
+                self._on_candle(pair, open_times[idx], closes[idx], settled)
+                self.last_candle[pair] = open_times[idx]
+
+        # File I/O happens outside the stats lock
+        if settled and STATS_JOURNAL_FILE:
+            self._journal(settled)
+
+    def _on_candle(self, pair, open_time, close, settled):
+        trades = self.open_trades.get(pair)
+        if not trades:
+            return
+        still_open = []
+        for trade in trades:
+            if open_time <= trade["open_time"]:
+                still_open.append(trade)
+                continue
+            sign = 1 if trade["direction"] == "BUY" else -1
+            trade["candles"] += 1
+
+            # Run length: consecutive closes moving in the signal direction
+            if trade["running"] and (close - trade["last_close"]) * sign > 0:
+                trade["run"] += 1
+                trade["running"] = trade["run"] < self.max_run
+            else:
+                trade["running"] = False
+            trade["last_close"] = close
+
+            if trade["candles"] == self.expiry_candles:
+                trade["move"] = (close - trade["entry"]) * sign
+
+            if trade["candles"] >= self.expiry_candles and not trade["running"]:
+                settled.append(self._settle(pair, trade))
+            else:
+                still_open.append(trade)
+        self.open_trades[pair] = still_open
+
+    def _settle(self, pair, trade):
+        """Add a finished trade to its rolling window; returns its journal row"""
+        if trade["move"] > 0:
+            win, pnl, result = 1, self.payout, "WIN"
+        elif trade["move"] < 0:
+            win, pnl, result = 0, -1.0, "LOSS"
+        else:
+            win, pnl, result = 0, 0.0, "DRAW"  # Stake refunded on a draw
+        key = (pair, trade["direction"])
+        window = self.windows.get(key)
+        if window is None:
+            window = self.windows[key] = RollingWindow(self.window)
+        window.add(win, trade["run"], pnl)
+        return [int(trade["open_time"]), pair, trade["direction"], trade["entry"], result, trade["run"]]
+
+    def _journal(self, rows):
+        """Append settled signals to the CSV journal used by risk_simulator.py"""
+        try:
+            with self.journal_lock:
+                new_file = not os.path.exists(STATS_JOURNAL_FILE)
+                with open(STATS_JOURNAL_FILE, "a", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    if new_file:
+                        writer.writerow(["open_time", "pair", "direction", "entry", "result", "run"])
+                    writer.writerows(rows)
+        except OSError as e:
+            print(f"Journal error: {str(e)}")
+
+    def get(self, pair, direction):
+        """Rolling summary for one pair and direction"""
+        with self.lock:
+            window = self.windows.get((pair, direction))
+            return window.summary() if window else RollingWindow(0).summary()
+
+    def snapshot(self):
+        """Rolling summaries for every pair and direction with settled or open trades"""
+        with self.lock:
+            open_counts = {}
+            for pair, trades in self.open_trades.items():
+                for trade in trades:
+                    key = (pair, trade["direction"])
+                    open_counts[key] = open_counts.get(key, 0) + 1
+
+            result = {}
+            for key in set(self.windows) | set(open_counts):
+                window = self.windows.get(key)
+                result[key] = window.summary() if window else RollingWindow(0).summary()
+                result[key]["open"] = open_counts.get(key, 0)
+            return result
+
+    def is_underperforming(self, pair, direction=None):
+        """True once enough trades settled and win rate is below the floor"""
+        directions = [direction] if direction else ["BUY", "SELL"]
+        for side in directions:
+            summary = self.get(pair, side)
+            if summary["trades"] >= STATS_PAUSE_MIN_TRADES and \
+               summary["win_rate"] < STATS_PAUSE_MIN_WIN_RATE:
+                return True
+        return False
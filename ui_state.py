@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Immutable dashboard snapshots passed from worker threads to the Tk thread
+
+import itertools
+import queue
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+# Mappings are frozen copies, but the DataFrames in frames and history are
+# shared with the signal generator, not copied. Readers must treat them as
+# read-only; the generator only ever replaces a cached frame with a new
+# object (apply_config copies before recomputing) and never mutates one
+# that has been published.
+DashboardSnapshot = namedtuple("DashboardSnapshot", [
+    "seq",             # Increases with every published snapshot
+    "config_generation",  # Config reloads applied when the snapshot was built
+    "signals",         # pair -> (signal, signal_time, direction, duration)
+    "update_time",
+    "next_refresh",
+    "active_signals",  # tuple of (pair, signal, entry_time, duration, status)
+    "stats",           # (pair, direction) -> rolling summary
+    "frames",          # pair -> analysed candles
+    "history",         # pair -> backfilled candles for the chart
+    "signal_marks",    # pair -> {open_time: signal}
+    "strategy_text",
+    "trading_pairs"
+])
+
+
+def freeze(mapping):
+    """Read-only view of a shallow copy"""
+    return MappingProxyType(dict(mapping))
+
+
+class StatePipeline:
+    """Bounded single-consumer queue where only the newest snapshot matters"""
+
+    def __init__(self, maxsize):
+        self.snapshots = queue.Queue(maxsize=maxsize)
+        self.errors = queue.Queue(maxsize=maxsize)
+        self.counter = itertools.count(1)
+        self.counter_lock = threading.Lock()
+
+    def next_seq(self):
+        with self.counter_lock:
+            return next(self.counter)
+
+    def publish(self, snapshot):
+        """Queue a snapshot, discarding the oldest when the consumer lags"""
+        while True:
+            try:
+                self.snapshots.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self.snapshots.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def report(self, title, message):
+        """Queue an error for the Tk thread; dropped if too many are pending"""
+        try:
+            self.errors.put_nowait((title, message))
+        except queue.Full:
+            pass
+
+    def drain(self, after_seq=0):
+        """Return the newest snapshot past after_seq (or None) and pending errors"""
+        latest = None
+        while True:
+            try:
+                snapshot = self.snapshots.get_nowait()
+            except queue.Empty:
+                break
+            if snapshot.seq > after_seq and (latest is None or snapshot.seq > latest.seq):
+                latest = snapshot
+
+        errors = []
+        while True:
+            try:
+                errors.append(self.errors.get_nowait())
+            except queue.Empty:
+                break
+        return latest, errors